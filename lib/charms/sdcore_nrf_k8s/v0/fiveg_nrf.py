@@ -110,7 +110,7 @@ LIBAPI = 0
 
 # Increment this PATCH version before using `charmcraft publish-lib` or reset
 # to 0 if you are raising the major API version
-LIBPATCH = 4
+LIBPATCH = 5
 
 PYDEPS = ["pydantic", "pytest-interface-tester"]
 
@@ -297,7 +297,7 @@ class NRFProvides(Object):
             raise RuntimeError(f"Relation {self.relation_name} not created yet.")
         if relation not in self.model.relations[self.relation_name]:
             raise RuntimeError(f"Relation {self.relation_name} not created yet.")
-        relation.data[self.charm.app].update({"url": url})
+        self._set_url_in_relation_data(relation, url)
 
     def set_nrf_information_in_all_relations(self, url: str) -> None:
         """Set NRF url in applications for all applications.
@@ -317,4 +317,17 @@ class NRFProvides(Object):
         if not relations:
             raise RuntimeError(f"Relation {self.relation_name} not created yet.")
         for relation in relations:
-            relation.data[self.charm.app].update({"url": url})
+            self._set_url_in_relation_data(relation, url)
+
+    def _set_url_in_relation_data(self, relation: Relation, url: str) -> None:
+        """Set NRF url in the application relation data.
+
+        The relation data is left untouched when it already holds the given url.
+
+        Args:
+            relation (Relation): Juju relation object.
+            url (str): NRF url.
+        """
+        if relation.data[self.charm.app].get("url") == url:
+            return
+        relation.data[self.charm.app].update({"url": url})
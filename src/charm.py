@@ -4,8 +4,12 @@
 
 """Charmed operator for the Aether SD-Core NRF service for K8s."""
 
+import functools
+import hashlib
 import logging
-from typing import List, Optional
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
 
 from charms.data_platform_libs.v0.data_interfaces import DatabaseRequires
 from charms.loki_k8s.v1.loki_push_api import LogForwarder
@@ -20,32 +24,36 @@ from charms.tls_certificates_interface.v4.tls_certificates import (
     Certificate,
     CertificateRequestAttributes,
     PrivateKey,
+    ProviderCertificate,
     TLSCertificatesRequiresV4,
 )
-from jinja2 import Environment, FileSystemLoader
 from ops import (
     ActiveStatus,
     BlockedStatus,
     CollectStatusEvent,
     ModelError,
     RelationBrokenEvent,
+    StatusBase,
     WaitingStatus,
     main,
 )
 from ops.charm import CharmBase, RelationJoinedEvent
-from ops.framework import EventBase
-from ops.pebble import Layer
+from ops.framework import EventBase, StoredState
+from ops.pebble import APIError, FileInfo, Layer, PathError
 
 logger = logging.getLogger(__name__)
 
 PROMETHEUS_PORT = 8080
 BASE_CONFIG_PATH = "/etc/nrf"
 CONFIG_FILE_NAME = "nrfcfg.yaml"
+CONFIG_FILE_PATH = f"{BASE_CONFIG_PATH}/{CONFIG_FILE_NAME}"
 DATABASE_NAME = "free5gc"
 NRF_SBI_PORT = 29510
 CERTS_DIR_PATH = "/support/TLS"
 PRIVATE_KEY_NAME = "nrf.key"
 CERTIFICATE_NAME = "nrf.pem"
+PRIVATE_KEY_PATH = f"{CERTS_DIR_PATH}/{PRIVATE_KEY_NAME}"
+CERTIFICATE_PATH = f"{CERTS_DIR_PATH}/{CERTIFICATE_NAME}"
 CERTIFICATE_COMMON_NAME = "nrf.sdcore"
 DATABASE_RELATION_NAME = "database"
 NRF_RELATION_NAME = "fiveg_nrf"
@@ -53,51 +61,128 @@ SDCORE_CONFIG_RELATION_NAME = "sdcore_config"
 TLS_RELATION_NAME = "certificates"
 LOGGING_RELATION_NAME = "logging"
 WORKLOAD_VERSION_FILE_NAME = "/etc/workload-version"
+ENVIRONMENT_VARIABLES = {
+    "GRPC_GO_LOG_VERBOSITY_LEVEL": "99",
+    "GRPC_GO_LOG_SEVERITY_LEVEL": "info",
+    "GRPC_TRACE": "all",
+    "GRPC_VERBOSITY": "debug",
+    "MANAGED_BY_CONFIG_POD": "true",
+}
+CERTIFICATE_REQUEST = CertificateRequestAttributes(
+    common_name=CERTIFICATE_COMMON_NAME,
+    sans_dns=frozenset([CERTIFICATE_COMMON_NAME]),
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_config_template() -> str:
+    """Return the nrfcfg template, read from disk once per process.
+
+    The template only holds `str.format` placeholders, as it has no control flow.
+    Its trailing newline is dropped, so that rendered files stay identical to the
+    ones previously rendered by Jinja2.
+
+    Returns:
+        str: nrfcfg template
+    """
+    return Path("src/templates/nrfcfg.yaml.fmt").read_text().removesuffix("\n")
+
+
+def _sha256(content: str) -> str:
+    """Return the hex SHA-256 digest of the given text."""
+    return hashlib.sha256(content.encode()).hexdigest()
 
 
 def _render_config(
-    database_name: str,
     database_url: str,
     webui_url: str,
     nrf_host: str,
-    nrf_sbi_port: int,
-    scheme: str,
-    tls_pem: str,
-    tls_key: str,
 ) -> str:
     """Render the nrfcfg config file.
 
     Args:
-        database_name: Name of the database
         database_url: URL of the database
         webui_url (str): URL of the Webui.
         nrf_host: Hostname or IP of the NRF service
-        nrf_sbi_port: Port of the NRF service
-        scheme: SBI interface scheme ("http" or "https")
-        tls_pem (str): TLS certificate file.
-        tls_key (str): TLS key file.
 
     Returns:
         str: Rendered config file content
     """
-    jinja2_environment = Environment(loader=FileSystemLoader("src/templates/"))
-    template = jinja2_environment.get_template("nrfcfg.yaml.j2")
-    content = template.render(
-        database_name=database_name,
+    return _get_config_template().format(
+        database_name=DATABASE_NAME,
         database_url=database_url,
         webui_url=webui_url,
-        nrf_sbi_port=nrf_sbi_port,
+        nrf_sbi_port=NRF_SBI_PORT,
         nrf_ip=nrf_host,
-        scheme=scheme,
-        tls_pem=tls_pem,
-        tls_key=tls_key,
+        scheme="https",
+        tls_pem=CERTIFICATE_PATH,
+        tls_key=PRIVATE_KEY_PATH,
     )
-    return content
+
+
+@dataclass
+class _Preconditions:
+    """Snapshot of the state the NRF configuration depends on.
+
+    The checks are evaluated in order and stop at the first one that is not met,
+    leaving the remaining fields to their default value.
+    """
+
+    can_connect: bool = False
+    missing_relations: List[str] = field(default_factory=list)
+    database_available: bool = False
+    database_uri: str = ""
+    webui_url: Optional[str] = None
+    storage_attached: bool = False
+    provider_certificate: Optional[ProviderCertificate] = None
+    private_key: Optional[PrivateKey] = None
+
+    @property
+    def ready_to_configure(self) -> bool:
+        """Return whether all preconditions to generate the configuration are met."""
+        return (
+            self.can_connect
+            and not self.missing_relations
+            and self.database_available
+            and bool(self.database_uri)
+            and bool(self.webui_url)
+            and self.storage_attached
+        )
+
+    @property
+    def certificate_available(self) -> bool:
+        """Return whether both the certificate and its private key are available."""
+        return bool(self.provider_certificate and self.private_key)
+
+    @property
+    def unmet_status(self) -> Optional[StatusBase]:
+        """Return the status describing the first precondition that is not met.
+
+        Returns:
+            StatusBase: Status to report, or None if all preconditions are met.
+        """
+        if not self.can_connect:
+            return WaitingStatus("Waiting for container to be ready")
+        if self.missing_relations:
+            return BlockedStatus(f"Waiting for {', '.join(self.missing_relations)} relation(s)")
+        if not self.database_available:
+            return WaitingStatus("Waiting for the database to be available")
+        if not self.database_uri:
+            return WaitingStatus("Waiting for database URI")
+        if not self.webui_url:
+            return WaitingStatus("Waiting for Webui data to be available")
+        if not self.storage_attached:
+            return WaitingStatus("Waiting for storage to be attached")
+        if not self.certificate_available:
+            return WaitingStatus("Waiting for certificates to be available")
+        return None
 
 
 class NRFOperatorCharm(CharmBase):
     """Main class to describe juju event handling for the SD-Core NRF operator for K8s."""
 
+    _stored = StoredState()
+
     def __init__(self, *args):
         """Initialize charm."""
         super().__init__(*args)
@@ -106,6 +191,17 @@ class NRFOperatorCharm(CharmBase):
             return
         self._container_name = self._service_name = "nrf"
         self._container = self.unit.get_container(self._container_name)
+        self._fs_cache: Dict[str, Optional[Dict[str, FileInfo]]] = {}
+        self._database_info_cache: Optional[dict] = None
+        self._preconditions: Optional[_Preconditions] = None
+        self._workload_version: Optional[str] = None
+        self._stored.set_default(
+            configuration_fingerprint="",
+            workload_version="",
+            config_file_digest="",
+            certificate_digest="",
+            private_key_digest="",
+        )
         self._database = DatabaseRequires(
             self, relation_name=DATABASE_RELATION_NAME, database_name=DATABASE_NAME
         )
@@ -114,7 +210,7 @@ class NRFOperatorCharm(CharmBase):
         self._certificates = TLSCertificatesRequiresV4(
             charm=self,
             relationship_name=TLS_RELATION_NAME,
-            certificate_requests=[self._get_certificate_request()],
+            certificate_requests=[CERTIFICATE_REQUEST],
         )
         self._logging = LogForwarder(charm=self, relation_name=LOGGING_RELATION_NAME)
         self._nrf_metrics_endpoint = MetricsEndpointProvider(
@@ -150,63 +246,147 @@ class NRFOperatorCharm(CharmBase):
         for the NRF workload, runs the Pebble services and exposes service information
         the requirers.
         """
+        self._fs_cache.clear()
+        self._preconditions = None
         if not self.ready_to_configure():
             logger.info("The preconditions for the configuration are not met yet.")
             return
-        if not self._certificate_is_available():
+        preconditions = self._get_preconditions()
+        if not preconditions.provider_certificate or not preconditions.private_key:
             logger.info("The certificate is not available yet.")
             return
-        certificate_update_required = self._check_and_update_certificate()
         desired_config_file = self._generate_nrf_config_file()
+        fingerprint = self._get_configuration_fingerprint(
+            config_file=desired_config_file,
+            certificate=preconditions.provider_certificate.certificate,
+            private_key=preconditions.private_key,
+        )
+        if (
+            fingerprint == self._stored.configuration_fingerprint
+            and self._nrf_service_is_running()
+        ):
+            logger.debug("The NRF configuration is already applied.")
+            self._publish_nrf_info_for_all_requirers()
+            return
+        certificate_update_required = self._check_and_update_certificate(
+            certificate=preconditions.provider_certificate.certificate,
+            private_key=preconditions.private_key,
+        )
         if config_update_required := self._is_config_update_required(desired_config_file):
             self._push_config_file(content=desired_config_file)
         self._configure_workload(restart=(config_update_required or certificate_update_required))
         self._publish_nrf_info_for_all_requirers()
+        self._stored.configuration_fingerprint = fingerprint
+
+    def _get_configuration_fingerprint(
+        self, config_file: str, certificate: Certificate, private_key: PrivateKey
+    ) -> str:
+        """Return a fingerprint of everything `_configure_nrf` applies to the workload.
+
+        Args:
+            config_file (str): Desired config file content.
+            certificate (Certificate): Certificate assigned by the TLS provider.
+            private_key (PrivateKey): Private key associated with the certificate.
+
+        Returns:
+            str: SHA-256 hex digest of the config file, TLS material, Pebble layer and NRF URL.
+        """
+        fingerprint = hashlib.sha256()
+        for item in (
+            config_file,
+            str(certificate),
+            str(private_key),
+            str(self._pebble_layer.to_dict()),
+            self._nrf_url,
+        ):
+            fingerprint.update(item.encode())
+            fingerprint.update(b"\0")
+        return fingerprint.hexdigest()
 
     def ready_to_configure(self) -> bool:
         """Return whether all preconditions are met to proceed with configuration."""
-        if not self._container.can_connect():
-            return False
-        if self._missing_relations():
-            return False
-        if not self._database_is_available():
-            return False
-        if not self._get_database_uri():
-            return False
-        if not self._webui_data_is_available:
-            return False
-        if not self._container.exists(path=BASE_CONFIG_PATH) or not self._container.exists(
-            path=CERTS_DIR_PATH
-        ):
-            return False
-        return True
+        return self._get_preconditions().ready_to_configure
+
+    def _get_preconditions(self) -> _Preconditions:
+        """Return the preconditions snapshot, evaluating it on first use.
+
+        The snapshot is shared by the configuration and the status collection of the
+        same hook, and is evaluated again whenever `_configure_nrf` starts.
+
+        Returns:
+            _Preconditions: State the NRF configuration depends on.
+        """
+        if self._preconditions is None:
+            self._preconditions = self._evaluate_preconditions()
+        return self._preconditions
 
-    def _check_and_update_certificate(self) -> bool:
+    def _evaluate_preconditions(self) -> _Preconditions:
+        """Evaluate the preconditions, stopping at the first one that is not met.
+
+        Returns:
+            _Preconditions: State the NRF configuration depends on.
+        """
+        preconditions = _Preconditions()
+        preconditions.can_connect = self._container.can_connect()
+        if not preconditions.can_connect:
+            return preconditions
+        preconditions.missing_relations = self._missing_relations()
+        if preconditions.missing_relations:
+            return preconditions
+        preconditions.database_available = self._database_is_available()
+        if not preconditions.database_available:
+            return preconditions
+        preconditions.database_uri = self._get_database_uri()
+        if not preconditions.database_uri:
+            return preconditions
+        preconditions.webui_url = self._webui.webui_url
+        if not preconditions.webui_url:
+            return preconditions
+        preconditions.storage_attached = self._storage_is_attached()
+        if not preconditions.storage_attached:
+            return preconditions
+        provider_certificate, private_key = self._certificates.get_assigned_certificate(
+            certificate_request=CERTIFICATE_REQUEST
+        )
+        preconditions.provider_certificate = provider_certificate
+        preconditions.private_key = private_key
+        return preconditions
+
+    def _check_and_update_certificate(
+        self, certificate: Certificate, private_key: PrivateKey
+    ) -> bool:
         """Check if the certificate or private key needs an update and perform the update.
 
-        This method retrieves the currently assigned certificate and private key associated with
-        the charm's TLS relation. It checks whether the certificate or private key has changed
-        or needs to be updated. If an update is necessary, the new certificate or private key is
-        stored.
+        This method checks whether the certificate or private key currently assigned to the
+        charm's TLS relation differs from the one stored in the workload. If an update is
+        necessary, the new certificate or private key is stored. Once the workload holds
+        them, their digests are recorded so later events can skip pulling the files.
+
+        Args:
+            certificate (Certificate): Certificate assigned by the TLS provider.
+            private_key (PrivateKey): Private key associated with the certificate.
 
         Returns:
             bool: True if either the certificate or the private key was updated, False otherwise.
         """
-        provider_certificate, private_key = self._certificates.get_assigned_certificate(
-            certificate_request=self._get_certificate_request()
+        certificate_digest = _sha256(str(certificate))
+        private_key_digest = _sha256(str(private_key))
+        certificate_update_required = self._is_certificate_update_required(
+            certificate, digest=certificate_digest
         )
-        if not provider_certificate or not private_key:
-            logger.debug("Certificate or private key is not available")
-            return False
-        if certificate_update_required := self._is_certificate_update_required(
-            provider_certificate.certificate
-        ):
-            self._store_certificate(certificate=provider_certificate.certificate)
-        if private_key_update_required := self._is_private_key_update_required(private_key):
-            self._store_private_key(private_key=private_key)
+        private_key_update_required = self._is_private_key_update_required(
+            private_key, digest=private_key_digest
+        )
+        if certificate_update_required or private_key_update_required:
+            self._store_tls_material(
+                certificate=certificate if certificate_update_required else None,
+                private_key=private_key if private_key_update_required else None,
+            )
+        self._stored.certificate_digest = certificate_digest
+        self._stored.private_key_digest = private_key_digest
         return certificate_update_required or private_key_update_required
 
-    def _on_collect_unit_status(self, event: CollectStatusEvent):  # noqa C901
+    def _on_collect_unit_status(self, event: CollectStatusEvent):
         """Check the unit status and set to Unit when CollectStatusEvent is fired.
 
         Sets the unit workload status if present in workload.
@@ -223,38 +403,15 @@ class NRFOperatorCharm(CharmBase):
             event.add_status(BlockedStatus("Scaling is not implemented for this charm"))
             logger.info("Scaling is not implemented for this charm")
             return
-        if not self._container.can_connect():
-            event.add_status(WaitingStatus("Waiting for container to be ready"))
-            logger.info("Waiting for container to be ready")
-            return
-        self.unit.set_workload_version(self._get_workload_version())
-        if missing_relations := self._missing_relations():
-            event.add_status(
-                BlockedStatus(f"Waiting for {', '.join(missing_relations)} relation(s)")
-            )
-            logger.info("Waiting for %s  relation", ", ".join(missing_relations))
-            return
-        if not self._database_is_available():
-            event.add_status(WaitingStatus("Waiting for the database to be available"))
-            logger.info("Waiting for the database to be available")
-            return
-        if not self._get_database_uri():
-            event.add_status(WaitingStatus("Waiting for database URI"))
-            logger.info("Waiting for database URI")
-            return
-        if not self._webui_data_is_available:
-            event.add_status(WaitingStatus("Waiting for Webui data to be available"))
-            logger.info("Waiting for Webui data to be available")
-            return
-        if not self._container.exists(path=BASE_CONFIG_PATH) or not self._container.exists(
-            path=CERTS_DIR_PATH
+        preconditions = self._get_preconditions()
+        if preconditions.can_connect and (
+            (workload_version := self._get_workload_version()) != self._stored.workload_version
         ):
-            event.add_status(WaitingStatus("Waiting for storage to be attached"))
-            logger.info("Waiting for storage to be attached")
-            return
-        if not self._certificate_is_available():
-            event.add_status(WaitingStatus("Waiting for certificates to be available"))
-            logger.info("Waiting for certificates to be available")
+            self.unit.set_workload_version(workload_version)
+            self._stored.workload_version = workload_version
+        if status := preconditions.unmet_status:
+            event.add_status(status)
+            logger.info(status.message)
             return
         if not self._nrf_service_is_running():
             event.add_status(WaitingStatus("Waiting for NRF service to start"))
@@ -267,19 +424,41 @@ class NRFOperatorCharm(CharmBase):
         if not self._container.can_connect():
             event.defer()
             return
+        self._fs_cache.clear()
+        self._stored.configuration_fingerprint = ""
         self._delete_private_key()
         self._delete_certificate()
 
-    def _certificate_is_available(self) -> bool:
-        cert, key = self._certificates.get_assigned_certificate(
-            certificate_request=self._get_certificate_request()
-        )
-        return bool(cert and key)
+    def _is_certificate_update_required(self, certificate: Certificate, digest: str) -> bool:
+        """Return whether the stored certificate differs from the given one.
 
-    def _is_certificate_update_required(self, certificate: Certificate) -> bool:
+        The stored file is only pulled when its digest recorded in StoredState differs.
+
+        Args:
+            certificate (Certificate): Certificate assigned by the TLS provider.
+            digest (str): SHA-256 digest of the certificate.
+
+        Returns:
+            bool: Whether the certificate needs to be pushed.
+        """
+        if self._certificate_is_stored() and self._stored.certificate_digest == digest:
+            return False
         return self._get_existing_certificate() != certificate
 
-    def _is_private_key_update_required(self, private_key: PrivateKey) -> bool:
+    def _is_private_key_update_required(self, private_key: PrivateKey, digest: str) -> bool:
+        """Return whether the stored private key differs from the given one.
+
+        The stored file is only pulled when its digest recorded in StoredState differs.
+
+        Args:
+            private_key (PrivateKey): Private key associated with the certificate.
+            digest (str): SHA-256 digest of the private key.
+
+        Returns:
+            bool: Whether the private key needs to be pushed.
+        """
+        if self._private_key_is_stored() and self._stored.private_key_digest == digest:
+            return False
         return self._get_existing_private_key() != private_key
 
     def _get_existing_certificate(self) -> Optional[Certificate]:
@@ -288,48 +467,109 @@ class NRFOperatorCharm(CharmBase):
     def _get_existing_private_key(self) -> Optional[PrivateKey]:
         return self._get_stored_private_key() if self._private_key_is_stored() else None
 
+    def _get_file_info(self, path: str) -> Optional[FileInfo]:
+        """Return the workload file information of a given path.
+
+        Args:
+            path (str): Absolute path of the file in the workload container
+
+        Returns:
+            FileInfo: File information, or None if the path does not exist.
+        """
+        directory, name = path.rsplit("/", 1)
+        if (files := self._list_directory(directory)) is None:
+            return None
+        return files.get(name)
+
+    def _list_directory(self, directory: str) -> Optional[Dict[str, FileInfo]]:
+        """Return the files of a workload directory, indexed by name.
+
+        The listing is cached until the charm writes to the directory, so that
+        all the existence checks done while handling an event share a single
+        Pebble call per directory.
+
+        Args:
+            directory (str): Absolute path of the directory in the workload container
+
+        Returns:
+            dict: Files of the directory, or None if the directory does not exist.
+        """
+        if directory not in self._fs_cache:
+            try:
+                files = self._container.list_files(directory)
+            except APIError as e:
+                if e.code != 404:
+                    raise
+                self._fs_cache[directory] = None
+            else:
+                self._fs_cache[directory] = {file.name: file for file in files}
+        return self._fs_cache[directory]
+
+    def _storage_is_attached(self) -> bool:
+        """Return whether the config and certs storages are attached to the workload.
+
+        Returns:
+            bool: Whether both storage directories exist.
+        """
+        return (
+            self._list_directory(BASE_CONFIG_PATH) is not None
+            and self._list_directory(CERTS_DIR_PATH) is not None
+        )
+
     def _delete_private_key(self):
         """Remove private key from workload."""
         if not self._private_key_is_stored():
             return
-        self._container.remove_path(path=f"{CERTS_DIR_PATH}/{PRIVATE_KEY_NAME}")
+        self._container.remove_path(path=PRIVATE_KEY_PATH)
+        self._fs_cache.pop(CERTS_DIR_PATH, None)
+        self._stored.private_key_digest = ""
         logger.info("Removed private key from workload")
 
     def _delete_certificate(self):
         """Delete certificate from workload."""
         if not self._certificate_is_stored():
             return
-        self._container.remove_path(path=f"{CERTS_DIR_PATH}/{CERTIFICATE_NAME}")
+        self._container.remove_path(path=CERTIFICATE_PATH)
+        self._fs_cache.pop(CERTS_DIR_PATH, None)
+        self._stored.certificate_digest = ""
         logger.info("Removed certificate from workload")
 
     def _private_key_is_stored(self) -> bool:
         """Return whether private key is stored in workload."""
-        return self._container.exists(path=f"{CERTS_DIR_PATH}/{PRIVATE_KEY_NAME}")
+        return self._get_file_info(path=PRIVATE_KEY_PATH) is not None
 
     def _get_stored_certificate(self) -> Certificate:
-        cert_string = str(self._container.pull(path=f"{CERTS_DIR_PATH}/{CERTIFICATE_NAME}").read())
+        cert_string = self._container.pull(path=CERTIFICATE_PATH, encoding="utf-8").read()
         return Certificate.from_string(cert_string)
 
     def _get_stored_private_key(self) -> PrivateKey:
-        key_string = str(self._container.pull(path=f"{CERTS_DIR_PATH}/{PRIVATE_KEY_NAME}").read())
+        key_string = self._container.pull(path=PRIVATE_KEY_PATH, encoding="utf-8").read()
         return PrivateKey.from_string(key_string)
 
     def _certificate_is_stored(self) -> bool:
         """Return whether certificate is stored in workload."""
-        return self._container.exists(path=f"{CERTS_DIR_PATH}/{CERTIFICATE_NAME}")
-
-    def _store_certificate(self, certificate: Certificate) -> None:
-        """Store certificate in workload."""
-        self._container.push(path=f"{CERTS_DIR_PATH}/{CERTIFICATE_NAME}", source=str(certificate))
-        logger.info("Pushed certificate to workload")
-
-    def _store_private_key(self, private_key: PrivateKey) -> None:
-        """Store private key in workload."""
-        self._container.push(
-            path=f"{CERTS_DIR_PATH}/{PRIVATE_KEY_NAME}",
-            source=str(private_key),
-        )
-        logger.info("Pushed private key to workload")
+        return self._get_file_info(path=CERTIFICATE_PATH) is not None
+
+    def _store_tls_material(
+        self,
+        certificate: Optional[Certificate] = None,
+        private_key: Optional[PrivateKey] = None,
+    ) -> None:
+        """Store the given certificate and private key in workload.
+
+        Args:
+            certificate (Certificate): Certificate to store, if it changed.
+            private_key (PrivateKey): Private key to store, if it changed.
+        """
+        pushed_files = []
+        if certificate is not None:
+            self._container.push(path=CERTIFICATE_PATH, source=str(certificate))
+            pushed_files.append(CERTIFICATE_NAME)
+        if private_key is not None:
+            self._container.push(path=PRIVATE_KEY_PATH, source=str(private_key))
+            pushed_files.append(PRIVATE_KEY_NAME)
+        self._fs_cache.pop(CERTS_DIR_PATH, None)
+        logger.info("Pushed %s to workload", ", ".join(pushed_files))
 
     def _get_workload_version(self) -> str:
         """Return the workload version.
@@ -337,17 +577,20 @@ class NRFOperatorCharm(CharmBase):
         Checks for the presence of /etc/workload-version file
         and if present, returns the contents of that file. If
         the file is not present, an empty string is returned.
+        The file does not change for the lifetime of the workload
+        image, so it is only read once per charm instance.
 
         Returns:
             string: A human readable string representing the
             version of the workload
         """
-        if self._container.exists(path=f"{WORKLOAD_VERSION_FILE_NAME}"):
-            version_file_content = self._container.pull(
-                path=f"{WORKLOAD_VERSION_FILE_NAME}"
-            ).read()
-            return version_file_content
-        return ""
+        if self._workload_version is None:
+            try:
+                version_file_content = self._container.pull(path=WORKLOAD_VERSION_FILE_NAME).read()
+            except PathError:
+                return ""
+            self._workload_version = version_file_content.strip()
+        return self._workload_version
 
     def _generate_nrf_config_file(self) -> str:
         """Handle creation of the NRF config file.
@@ -360,18 +603,17 @@ class NRFOperatorCharm(CharmBase):
         if not self._webui.webui_url:
             return ""
         return _render_config(
-            database_url=self._database_info()["uris"].split(",")[0],
-            nrf_host=self.model.app.name,
-            database_name=DATABASE_NAME,
+            database_url=self._get_database_uri(),
             webui_url=self._webui.webui_url,
-            nrf_sbi_port=NRF_SBI_PORT,
-            scheme="https",
-            tls_pem=f"{CERTS_DIR_PATH}/{CERTIFICATE_NAME}",
-            tls_key=f"{CERTS_DIR_PATH}/{PRIVATE_KEY_NAME}",
+            nrf_host=self.model.app.name,
         )
 
     def _is_config_update_required(self, content: str) -> bool:
-        """Decide whether config update is required by checking existence and config content.
+        """Decide whether the config file needs to be pushed to the workload.
+
+        The update is required when the file is missing or its size differs. Otherwise
+        the file is up to date if its digest recorded in StoredState matches the desired
+        content; only when it does not is the file pulled and compared.
 
         Args:
             content (str): desired config file content
@@ -379,27 +621,24 @@ class NRFOperatorCharm(CharmBase):
         Returns:
             True if config update is required else False
         """
-        if not self._config_file_is_written() or not self._config_file_content_matches(
-            content=content
-        ):
-            return True
-        return False
+        return not self._config_file_content_matches(content=content)
 
-    def _config_file_is_written(self) -> bool:
-        """Return whether the config file was written to the workload container.
+    def _configure_workload(self, restart: bool = False) -> None:
+        """Configure pebble layer for the nrf container.
 
-        Returns:
-            bool: Whether the config file was written.
-        """
-        return bool(self._container.exists(f"{BASE_CONFIG_PATH}/{CONFIG_FILE_NAME}"))
+        When the layer changes, the replan already (re)starts the service with the
+        current config file and certificates, so no additional restart is issued.
 
-    def _configure_workload(self, restart: bool = False) -> None:
-        """Configure pebble layer for the nrf container."""
+        Args:
+            restart (bool): Whether the service needs to be restarted to apply
+                changes to its config file or certificates.
+        """
         plan = self._container.get_plan()
         if plan.services != self._pebble_layer.services:
             self._container.add_layer(self._container_name, self._pebble_layer, combine=True)
             self._container.replan()
             logger.info("New layer added: %s", self._pebble_layer)
+            return
         if restart:
             self._container.restart(self._service_name)
             logger.info("Restarted container %s", self._service_name)
@@ -408,14 +647,28 @@ class NRFOperatorCharm(CharmBase):
     def _config_file_content_matches(self, content: str) -> bool:
         """Return whether the nrfcfg config file content matches the provided content.
 
+        The size reported by the file listing is compared first, so that the file
+        is only pulled when it could actually match. Once the content has been
+        pushed or verified, its digest is kept so later events skip the pull.
+
         Returns:
             bool: Whether the nrfcfg config file content matches
         """
-        if not self._container.exists(path=f"{BASE_CONFIG_PATH}/{CONFIG_FILE_NAME}"):
+        file_info = self._get_file_info(path=CONFIG_FILE_PATH)
+        if not file_info:
+            return False
+        if file_info.size != len(content.encode()):
             return False
-        existing_content = self._container.pull(path=f"{BASE_CONFIG_PATH}/{CONFIG_FILE_NAME}")
-        if existing_content.read() != content:
+        digest = _sha256(content)
+        if self._stored.config_file_digest == digest:
+            return True
+        try:
+            existing_content = self._container.pull(path=CONFIG_FILE_PATH).read()
+        except PathError:
             return False
+        if existing_content != content:
+            return False
+        self._stored.config_file_digest = digest
         return True
 
     def _on_fiveg_nrf_relation_joined(self, event: RelationJoinedEvent) -> None:
@@ -426,9 +679,8 @@ class NRFOperatorCharm(CharmBase):
         """
         if not self._nrf_service_is_running():
             return
-        nrf_url = self._get_nrf_url()
         self.nrf_provider.set_nrf_information(
-            url=nrf_url,
+            url=self._nrf_url,
             relation_id=event.relation.id,
         )
 
@@ -436,15 +688,7 @@ class NRFOperatorCharm(CharmBase):
         """Publish nrf information in the databags of all relations requiring it."""
         if not self._relation_created(NRF_RELATION_NAME):
             return
-        nrf_url = self._get_nrf_url()
-        self.nrf_provider.set_nrf_information_in_all_relations(nrf_url)
-
-    @staticmethod
-    def _get_certificate_request() -> CertificateRequestAttributes:
-        return CertificateRequestAttributes(
-            common_name=CERTIFICATE_COMMON_NAME,
-            sans_dns=frozenset([CERTIFICATE_COMMON_NAME]),
-        )
+        self.nrf_provider.set_nrf_information_in_all_relations(self._nrf_url)
 
     def _missing_relations(self) -> List[str]:
         missing_relations = []
@@ -472,7 +716,9 @@ class NRFOperatorCharm(CharmBase):
         """
         if not self._container.can_connect():
             return
-        self._container.push(path=f"{BASE_CONFIG_PATH}/{CONFIG_FILE_NAME}", source=content)
+        self._container.push(path=CONFIG_FILE_PATH, source=content)
+        self._fs_cache.pop(BASE_CONFIG_PATH, None)
+        self._stored.config_file_digest = _sha256(content)
         logger.info("Pushed %s config file to workload", CONFIG_FILE_NAME)
 
     def _database_is_available(self) -> bool:
@@ -486,12 +732,19 @@ class NRFOperatorCharm(CharmBase):
     def _database_info(self) -> dict:
         """Return the database data.
 
+        The relation data is fetched once and reused for the rest of the hook,
+        since Juju does not change it while the hook runs.
+
         Returns:
             Dict: The database data.
         """
-        if not self._database_is_available():
-            raise RuntimeError(f"Database `{DATABASE_NAME}` is not available")
-        return self._database.fetch_relation_data()[self._database.relations[0].id]
+        if self._database_info_cache is None:
+            if not self._database_is_available():
+                raise RuntimeError(f"Database `{DATABASE_NAME}` is not available")
+            self._database_info_cache = self._database.fetch_relation_data()[
+                self._database.relations[0].id
+            ]
+        return self._database_info_cache
 
     def _get_database_uri(self) -> str:
         """Return the database URI.
@@ -504,14 +757,12 @@ class NRFOperatorCharm(CharmBase):
         except KeyError:
             return ""
 
-    @property
-    def _webui_data_is_available(self) -> bool:
-        return bool(self._webui.webui_url)
-
-    @property
+    @functools.cached_property
     def _pebble_layer(self) -> Layer:
         """Return pebble layer for the charm.
 
+        The layer only depends on constants, so it is built once per charm instance.
+
         Returns:
             Layer: Pebble Layer
         """
@@ -523,28 +774,13 @@ class NRFOperatorCharm(CharmBase):
                     "nrf": {
                         "override": "replace",
                         "startup": "enabled",
-                        "command": f"/bin/nrf --cfg {BASE_CONFIG_PATH}/{CONFIG_FILE_NAME}",
-                        "environment": self._environment_variables,
+                        "command": f"/bin/nrf --cfg {CONFIG_FILE_PATH}",
+                        "environment": ENVIRONMENT_VARIABLES,
                     },
                 },
             }
         )
 
-    @property
-    def _environment_variables(self) -> dict:
-        """Return workload service environment variables.
-
-        Returns:
-            dict: Environment variables
-        """
-        return {
-            "GRPC_GO_LOG_VERBOSITY_LEVEL": "99",
-            "GRPC_GO_LOG_SEVERITY_LEVEL": "info",
-            "GRPC_TRACE": "all",
-            "GRPC_VERBOSITY": "debug",
-            "MANAGED_BY_CONFIG_POD": "true",
-        }
-
     def _nrf_service_is_running(self) -> bool:
         """Return whether the NRF service is running.
 
@@ -559,7 +795,8 @@ class NRFOperatorCharm(CharmBase):
             return False
         return service.is_running()
 
-    def _get_nrf_url(self) -> str:
+    @functools.cached_property
+    def _nrf_url(self) -> str:
         """Return NRF URL."""
         return f"https://{self.model.app.name}:{NRF_SBI_PORT}"
 
@@ -3,6 +3,7 @@
 # See LICENSE file for licensing details.
 
 import os
+from pathlib import Path
 
 import pytest
 
@@ -16,7 +17,10 @@ def pytest_addoption(parser: pytest.Parser) -> None:
       parser: The pytest command line parser.
     """
     parser.addoption(
-        "--charm_path", action="store", default=None, help="Path to the charm under test"
+        "--charm_path",
+        action="store",
+        default=os.environ.get("CHARM_PATH"),
+        help="Path to the charm under test (defaults to the CHARM_PATH environment variable)",
     )
 
 
@@ -28,8 +32,17 @@ def pytest_configure(config: pytest.Config) -> None:
     Args:
       config: The pytest configuration object.
     """
-    charm_path = str(config.getoption("--charm_path"))
+    charm_path = config.getoption("--charm_path")
     if not charm_path:
-        pytest.exit("The --charm_path option is required. Tests aborted.")
+        pytest.exit("The --charm_path option (or CHARM_PATH) is required. Tests aborted.")
     if not os.path.exists(charm_path):
         pytest.exit(f"The path specified for the charm under test does not exist: {charm_path}")
+
+
+@pytest.fixture(scope="session")
+def charm(request: pytest.FixtureRequest) -> Path:
+    """Return the path of the prebuilt charm under test.
+
+    The charm is packed once, outside of the test session, and shared by every test module.
+    """
+    return Path(str(request.config.getoption("--charm_path"))).resolve()
@@ -2,7 +2,7 @@
 # Copyright 2023 Canonical Ltd.
 # See LICENSE file for licensing details.
 
-
+import asyncio
 import logging
 from collections import Counter
 from pathlib import Path
@@ -12,9 +12,14 @@ import yaml
 from juju.application import Application
 from pytest_operator.plugin import OpsTest
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
-METADATA = yaml.safe_load(Path("./charmcraft.yaml").read_text())
+METADATA = yaml.load(Path("./charmcraft.yaml").read_text(), Loader=SafeLoader)
 APP_NAME = METADATA["name"]
 DB_CHARM_NAME = "mongodb-k8s"
 DB_CHARM_CHANNEL = "6/stable"
@@ -29,13 +34,12 @@ TIMEOUT = 15 * 60
 
 
 @pytest.fixture(scope="module")
-async def deploy(ops_test: OpsTest, request):
+async def deploy(ops_test: OpsTest, charm: Path):
     """Deploy the charm-under-test together with related charms.
 
     Assert on the unit status before any relations/configurations take place.
     """
     assert ops_test.model
-    charm = Path(request.config.getoption("--charm_path")).resolve()
     resources = {"nrf-image": METADATA["resources"]["nrf-image"]["upstream-source"]}
     await ops_test.model.deploy(
         charm,
@@ -45,16 +49,27 @@ async def deploy(ops_test: OpsTest, request):
     )
 
 
+@pytest.fixture
+def nrf_app(ops_test: OpsTest, deploy) -> Application:
+    """Return the deployed charm-under-test application."""
+    assert ops_test.model
+    assert isinstance(app := ops_test.model.applications[APP_NAME], Application)
+    return app
+
+
 @pytest.mark.abort_on_fail
 async def test_given_charm_is_built_when_deployed_then_status_is_blocked(
     ops_test: OpsTest,
     deploy,
 ):
     assert ops_test.model
-    await _deploy_mongodb(ops_test)
-    await _deploy_self_signed_certificates(ops_test)
+    await asyncio.gather(
+        _deploy_mongodb(ops_test),
+        _deploy_self_signed_certificates(ops_test),
+        _deploy_grafana_agent(ops_test),
+    )
+    # NMS is integrated with the database and TLS provider, so they must exist first
     await _deploy_nms(ops_test)
-    await _deploy_grafana_agent(ops_test)
     await ops_test.model.wait_for_idle(
         apps=[APP_NAME],
         status="blocked",
@@ -66,77 +81,82 @@ async def test_given_charm_is_deployed_when_relate_to_mongo_nms_and_certificates
     ops_test: OpsTest, deploy
 ):
     assert ops_test.model
-    await ops_test.model.integrate(
-        relation1=f"{APP_NAME}:database", relation2=f"{DB_CHARM_NAME}:database"
-    )
-    await ops_test.model.integrate(relation1=APP_NAME, relation2=NMS_CHARM_NAME)
-    await ops_test.model.integrate(
-        relation1=f"{APP_NAME}:certificates", relation2=f"{TLS_CHARM_NAME}:certificates"
-    )
-    await ops_test.model.integrate(
-        relation1=f"{APP_NAME}:logging",
-        relation2=f"{GRAFANA_AGENT_CHARM_NAME}:logging-provider",
-    )
-    await ops_test.model.integrate(
-        relation1=f"{APP_NAME}:metrics-endpoint",
-        relation2=f"{GRAFANA_AGENT_CHARM_NAME}:metrics-endpoint",
+    await asyncio.gather(
+        ops_test.model.integrate(
+            relation1=f"{APP_NAME}:database", relation2=f"{DB_CHARM_NAME}:database"
+        ),
+        ops_test.model.integrate(relation1=APP_NAME, relation2=NMS_CHARM_NAME),
+        ops_test.model.integrate(
+            relation1=f"{APP_NAME}:certificates", relation2=f"{TLS_CHARM_NAME}:certificates"
+        ),
+        ops_test.model.integrate(
+            relation1=f"{APP_NAME}:logging",
+            relation2=f"{GRAFANA_AGENT_CHARM_NAME}:logging-provider",
+        ),
+        ops_test.model.integrate(
+            relation1=f"{APP_NAME}:metrics-endpoint",
+            relation2=f"{GRAFANA_AGENT_CHARM_NAME}:metrics-endpoint",
+        ),
     )
     await ops_test.model.wait_for_idle(apps=[APP_NAME], status="active", timeout=TIMEOUT)
 
 
 @pytest.mark.abort_on_fail
-async def test_remove_tls_and_wait_for_blocked_status(ops_test: OpsTest, deploy):
+async def test_remove_tls_and_wait_for_blocked_status(ops_test: OpsTest, nrf_app: Application):
     assert ops_test.model
-    await ops_test.model.remove_application(TLS_CHARM_NAME, block_until_done=True)
+    await nrf_app.remove_relation("certificates", f"{TLS_CHARM_NAME}:certificates")
     await ops_test.model.wait_for_idle(apps=[APP_NAME], status="blocked", timeout=TIMEOUT)
 
 
 @pytest.mark.abort_on_fail
 async def test_restore_tls_and_wait_for_active_status(ops_test: OpsTest, deploy):
     assert ops_test.model
-    await _deploy_self_signed_certificates(ops_test)
-    await ops_test.model.integrate(relation1=APP_NAME, relation2=TLS_CHARM_NAME)
-    await ops_test.model.integrate(relation1=NMS_CHARM_NAME, relation2=TLS_CHARM_NAME)
+    await ops_test.model.integrate(
+        relation1=f"{APP_NAME}:certificates", relation2=f"{TLS_CHARM_NAME}:certificates"
+    )
     await ops_test.model.wait_for_idle(apps=[APP_NAME], status="active", timeout=TIMEOUT)
 
 
 @pytest.mark.abort_on_fail
-async def test_remove_database_and_wait_for_blocked_status(ops_test: OpsTest, deploy):
+async def test_remove_database_and_wait_for_blocked_status(
+    ops_test: OpsTest, nrf_app: Application
+):
     assert ops_test.model
-    await ops_test.model.remove_application(DB_CHARM_NAME, block_until_done=True)
+    await nrf_app.remove_relation("database", f"{DB_CHARM_NAME}:database")
     await ops_test.model.wait_for_idle(apps=[APP_NAME], status="blocked", timeout=TIMEOUT)
 
 
 @pytest.mark.abort_on_fail
 async def test_restore_database_and_wait_for_active_status(ops_test: OpsTest, deploy):
     assert ops_test.model
-    await _deploy_mongodb(ops_test)
-    await ops_test.model.integrate(relation1=APP_NAME, relation2=DB_CHARM_NAME)
+    await ops_test.model.integrate(
+        relation1=f"{APP_NAME}:database", relation2=f"{DB_CHARM_NAME}:database"
+    )
     await ops_test.model.wait_for_idle(apps=[APP_NAME], status="active", timeout=TIMEOUT)
 
 
 @pytest.mark.abort_on_fail
-async def test_remove_nms_and_wait_for_blocked_status(ops_test: OpsTest, deploy):
+async def test_remove_nms_and_wait_for_blocked_status(ops_test: OpsTest, nrf_app: Application):
     assert ops_test.model
-    await ops_test.model.remove_application(NMS_CHARM_NAME, block_until_done=True)
+    await nrf_app.remove_relation("sdcore_config", NMS_CHARM_NAME)
     await ops_test.model.wait_for_idle(apps=[APP_NAME], status="blocked", timeout=TIMEOUT)
 
 
 @pytest.mark.abort_on_fail
 async def test_restore_nms_and_wait_for_active_status(ops_test: OpsTest, deploy):
     assert ops_test.model
-    await _deploy_nms(ops_test)
-    await ops_test.model.integrate(relation1=APP_NAME, relation2=NMS_CHARM_NAME)
+    await ops_test.model.integrate(relation1=f"{APP_NAME}:sdcore_config", relation2=NMS_CHARM_NAME)
     await ops_test.model.wait_for_idle(apps=[APP_NAME], status="active", timeout=TIMEOUT)
 
 
 @pytest.mark.abort_on_fail
-async def test_when_scale_nrf_beyond_1_then_only_one_unit_is_active(ops_test: OpsTest, deploy):
+async def test_when_scale_nrf_beyond_1_then_only_one_unit_is_active(
+    ops_test: OpsTest, nrf_app: Application
+):
     assert ops_test.model
-    assert isinstance(app := ops_test.model.applications[APP_NAME], Application)
-    await app.scale(3)
+    await nrf_app.scale(3)
     await ops_test.model.wait_for_idle(apps=[APP_NAME], timeout=TIMEOUT, wait_for_at_least_units=3)
-    unit_statuses = Counter(unit.workload_status for unit in app.units)
+    unit_statuses = Counter(unit.workload_status for unit in nrf_app.units)
     assert unit_statuses.get("active") == 1
     assert unit_statuses.get("blocked") == 2
 
@@ -164,16 +184,18 @@ async def _deploy_nms(ops_test: OpsTest):
         channel=NMS_CHARM_CHANNEL,
         base=SDCORE_CHARMS_BASE,
     )
-    await ops_test.model.integrate(
-        relation1=f"{NMS_CHARM_NAME}:common_database", relation2=DB_CHARM_NAME
-    )
-    await ops_test.model.integrate(
-        relation1=f"{NMS_CHARM_NAME}:auth_database", relation2=DB_CHARM_NAME
-    )
-    await ops_test.model.integrate(
-        relation1=f"{NMS_CHARM_NAME}:webui_database", relation2=DB_CHARM_NAME
+    await asyncio.gather(
+        ops_test.model.integrate(
+            relation1=f"{NMS_CHARM_NAME}:common_database", relation2=DB_CHARM_NAME
+        ),
+        ops_test.model.integrate(
+            relation1=f"{NMS_CHARM_NAME}:auth_database", relation2=DB_CHARM_NAME
+        ),
+        ops_test.model.integrate(
+            relation1=f"{NMS_CHARM_NAME}:webui_database", relation2=DB_CHARM_NAME
+        ),
+        ops_test.model.integrate(relation1=NMS_CHARM_NAME, relation2=TLS_CHARM_NAME),
     )
-    await ops_test.model.integrate(relation1=NMS_CHARM_NAME, relation2=TLS_CHARM_NAME)
 
 
 async def _deploy_grafana_agent(ops_test: OpsTest):
@@ -2,8 +2,12 @@
 # See LICENSE file for licensing details.
 
 from datetime import timedelta
+from functools import cache
+from pathlib import Path
 
 from charms.tls_certificates_interface.v4.tls_certificates import (
+    Certificate,
+    CertificateSigningRequest,
     PrivateKey,
     ProviderCertificate,
     generate_ca,
@@ -13,7 +17,11 @@ from charms.tls_certificates_interface.v4.tls_certificates import (
 )
 
 
-def example_cert_and_key(tls_relation_id: int) -> tuple[ProviderCertificate, PrivateKey]:
+@cache
+def _example_tls_material() -> tuple[
+    PrivateKey, CertificateSigningRequest, Certificate, Certificate
+]:
+    """Generate the key, CSR, CA and certificate once; RSA key generation is slow."""
     private_key = generate_private_key()
     csr = generate_csr(
         private_key=private_key,
@@ -31,6 +39,11 @@ def example_cert_and_key(tls_relation_id: int) -> tuple[ProviderCertificate, Pri
         ca_private_key=ca_private_key,
         validity=timedelta(days=365),
     )
+    return private_key, csr, ca_certificate, certificate
+
+
+def example_cert_and_key(tls_relation_id: int) -> tuple[ProviderCertificate, PrivateKey]:
+    private_key, csr, ca_certificate, certificate = _example_tls_material()
     provider_certificate = ProviderCertificate(
         relation_id=tls_relation_id,
         certificate=certificate,
@@ -39,3 +52,9 @@ def example_cert_and_key(tls_relation_id: int) -> tuple[ProviderCertificate, Pri
         chain=[ca_certificate],
     )
     return provider_certificate, private_key
+
+
+def store_certificate_and_key(directory: Path, certificate: str, private_key: str) -> None:
+    """Write the NRF certificate and private key as the charm stores them."""
+    (directory / "nrf.pem").write_text(certificate)
+    (directory / "nrf.key").write_text(private_key)
@@ -1,11 +1,10 @@
 # Copyright 2024 Canonical Ltd.
 # See LICENSE file for licensing details.
 
-from unittest.mock import patch
-
 import pytest
 from ops import testing
 from ops.charm import ActionEvent, CharmBase
+from ops.model import RelationDataContent
 
 from lib.charms.sdcore_nrf_k8s.v0.fiveg_nrf import NRFProvides
 
@@ -43,18 +42,16 @@ class DummyFiveGNRFProviderCharm(CharmBase):
         )
 
 
-class TestFiveGNRFProvider:
-    @pytest.fixture(autouse=True)
-    def setUp(self, request):
-        yield
-        request.addfinalizer(self.tearDown)
+def _nrf_relation(**kwargs) -> testing.Relation:
+    """Return a new fiveg_nrf relation with its own relation ID."""
+    return testing.Relation(endpoint="fiveg_nrf", interface="fiveg_nrf", **kwargs)
 
-    def tearDown(self) -> None:
-        patch.stopall()
 
-    @pytest.fixture(autouse=True)
-    def context(self):
-        self.ctx = testing.Context(
+class TestFiveGNRFProvider:
+    @pytest.fixture(scope="class", autouse=True)
+    @classmethod
+    def context(cls):
+        cls.ctx = testing.Context(
             charm_type=DummyFiveGNRFProviderCharm,
             meta={
                 "name": "nrf-provider-charm",
@@ -71,10 +68,7 @@ class TestFiveGNRFProvider:
     def test_given_unit_is_leader_when_set_nrf_information_then_data_is_in_application_databag(  # noqa: E501
         self,
     ):
-        nrf_relation = testing.Relation(
-            endpoint="fiveg_nrf",
-            interface="fiveg_nrf",
-        )
+        nrf_relation = _nrf_relation()
         state_in = testing.State(
             leader=True,
             relations=[nrf_relation],
@@ -94,10 +88,7 @@ class TestFiveGNRFProvider:
     def test_given_unit_is_not_leader_when_set_nrf_information_then_data_is_not_in_application_databag(  # noqa: E501
         self,
     ):
-        nrf_relation = testing.Relation(
-            endpoint="fiveg_nrf",
-            interface="fiveg_nrf",
-        )
+        nrf_relation = _nrf_relation()
         state_in = testing.State(
             leader=False,
             relations=[nrf_relation],
@@ -115,10 +106,7 @@ class TestFiveGNRFProvider:
     def test_given_provided_nrf_url_is_not_valid_when_set_nrf_information_then_error_is_raised(  # noqa: E501
         self,
     ):
-        nrf_relation = testing.Relation(
-            endpoint="fiveg_nrf",
-            interface="fiveg_nrf",
-        )
+        nrf_relation = _nrf_relation()
         state_in = testing.State(
             leader=True,
             relations=[nrf_relation],
@@ -153,14 +141,8 @@ class TestFiveGNRFProvider:
     def test_given_unit_is_leader_when_set_nrf_information_in_all_relations_then_data_in_application_databag(  # noqa: E501
         self,
     ):
-        nrf_relation_1 = testing.Relation(
-            endpoint="fiveg_nrf",
-            interface="fiveg_nrf",
-        )
-        nrf_relation_2 = testing.Relation(
-            endpoint="fiveg_nrf",
-            interface="fiveg_nrf",
-        )
+        nrf_relation_1 = _nrf_relation()
+        nrf_relation_2 = _nrf_relation()
         state_in = testing.State(
             leader=True,
             relations=[nrf_relation_1, nrf_relation_2],
@@ -177,3 +159,50 @@ class TestFiveGNRFProvider:
         relation_2 = state_out.get_relation(nrf_relation_2.id)
         assert relation_1.local_app_data["url"] == "http://whatever.url.com"
         assert relation_2.local_app_data["url"] == "http://whatever.url.com"
+
+    def test_given_url_already_in_databag_when_set_nrf_information_in_all_relations_then_relation_data_is_not_written(  # noqa: E501
+        self, monkeypatch
+    ):
+        nrf_relation = _nrf_relation(local_app_data={"url": "http://whatever.url.com"})
+        state_in = testing.State(
+            leader=True,
+            relations=[nrf_relation],
+        )
+        params = {
+            "url": "http://whatever.url.com",
+        }
+        updates = []
+        update = RelationDataContent.update
+
+        def record_update(content, data):
+            updates.append(data)
+            update(content, data)
+
+        monkeypatch.setattr(RelationDataContent, "update", record_update)
+
+        state_out = self.ctx.run(
+            self.ctx.on.action("set-nrf-information-in-all-relations", params=params), state_in
+        )
+
+        assert updates == []
+        relation = state_out.get_relation(nrf_relation.id)
+        assert relation.local_app_data == {"url": "http://whatever.url.com"}
+
+    def test_given_different_url_in_databag_when_set_nrf_information_in_all_relations_then_url_is_overwritten(  # noqa: E501
+        self,
+    ):
+        nrf_relation = _nrf_relation(local_app_data={"url": "http://old.url.com"})
+        state_in = testing.State(
+            leader=True,
+            relations=[nrf_relation],
+        )
+        params = {
+            "url": "http://whatever.url.com",
+        }
+
+        state_out = self.ctx.run(
+            self.ctx.on.action("set-nrf-information-in-all-relations", params=params), state_in
+        )
+
+        relation = state_out.get_relation(nrf_relation.id)
+        assert relation.local_app_data["url"] == "http://whatever.url.com"
@@ -1,8 +1,6 @@
 # Copyright 2024 Canonical Ltd.
 # See LICENSE file for licensing details.
 
-from unittest.mock import patch
-
 import pytest
 from ops import testing
 from ops.charm import ActionEvent, CharmBase
@@ -23,15 +21,12 @@ class DummyFiveGNRFRequirerCharm(CharmBase):
         event.set_results({"nrf-url": self.nrf_requirer.nrf_url})
 
 
-class TestFiveGNRFRequirer:
-    @pytest.fixture(autouse=True)
-    def setUp(self, request):
-        yield
-        request.addfinalizer(self.tearDown)
+def _nrf_relation(**kwargs) -> testing.Relation:
+    """Return a new fiveg_nrf relation with its own relation ID."""
+    return testing.Relation(endpoint="fiveg_nrf", interface="fiveg_nrf", **kwargs)
 
-    def tearDown(self) -> None:
-        patch.stopall()
 
+class TestFiveGNRFRequirer:
     @pytest.fixture(autouse=True)
     def context(self):
         self.ctx = testing.Context(
@@ -48,13 +43,7 @@ class TestFiveGNRFRequirer:
     def test_given_nrf_information_in_relation_data_when_relation_changed_then_nrf_available_event_emitted(  # noqa: E501
         self,
     ):
-        nrf_relation = testing.Relation(
-            endpoint="fiveg_nrf",
-            interface="fiveg_nrf",
-            remote_app_data={
-                "url": "http://nrf.com",
-            },
-        )
+        nrf_relation = _nrf_relation(remote_app_data={"url": "http://nrf.com"})
         state_in = testing.State(
             relations=[nrf_relation],
         )
@@ -65,13 +54,17 @@ class TestFiveGNRFRequirer:
         assert isinstance(self.ctx.emitted_events[1], NRFAvailableEvent)
         assert self.ctx.emitted_events[1].url == "http://nrf.com"
 
-    def test_given_nrf_information_not_in_relation_data_when_relation_changed_then_nrf_available_event_not_emitted(  # noqa: E501
-        self,
+    @pytest.mark.parametrize(
+        "relation_data,expected_log",
+        [
+            ({}, "Invalid relation data: {}"),
+            ({"pizza": "steak"}, "Invalid relation data: {'pizza': 'steak'}"),
+        ],
+    )
+    def test_given_invalid_nrf_information_in_relation_data_when_relation_changed_then_nrf_available_event_not_emitted_and_error_is_logged(  # noqa: E501
+        self, caplog, relation_data, expected_log
     ):
-        nrf_relation = testing.Relation(
-            endpoint="fiveg_nrf",
-            interface="fiveg_nrf",
-        )
+        nrf_relation = _nrf_relation(remote_app_data=relation_data)
         state_in = testing.State(
             relations=[nrf_relation],
         )
@@ -79,110 +72,34 @@ class TestFiveGNRFRequirer:
         self.ctx.run(self.ctx.on.relation_changed(nrf_relation), state_in)
 
         assert len(self.ctx.emitted_events) == 1
-
-    def test_given_invalid_nrf_information_in_relation_data_when_relation_changed_then_nrf_available_event_not_emitted(  # noqa: E501
-        self,
-    ):
-        nrf_relation = testing.Relation(
-            endpoint="fiveg_nrf",
-            interface="fiveg_nrf",
-            remote_app_data={
-                "pizza": "steak",
-            },
-        )
-        state_in = testing.State(
-            relations=[nrf_relation],
-        )
-
-        self.ctx.run(self.ctx.on.relation_changed(nrf_relation), state_in)
-
-        assert len(self.ctx.emitted_events) == 1
-
-    def test_given_invalid_nrf_information_in_relation_data_when_relation_changed_then_error_is_logged(  # noqa: E501
-        self, caplog
-    ):
-        nrf_relation = testing.Relation(
-            endpoint="fiveg_nrf",
-            interface="fiveg_nrf",
-            remote_app_data={
-                "pizza": "steak",
-            },
-        )
-        state_in = testing.State(
-            relations=[nrf_relation],
-        )
-
-        self.ctx.run(self.ctx.on.relation_changed(nrf_relation), state_in)
-
-        assert "Invalid relation data: {'pizza': 'steak'}" in caplog.messages
-
-    def test_given_nrf_information_in_relation_data_when_get_nrf_url_is_called_then_expected_url_is_returned(  # noqa: E501
-        self,
+        assert expected_log in caplog.messages
+
+    @pytest.mark.parametrize(
+        "relation_data,expected_url,expected_log",
+        [
+            ({"url": "http://nrf.com"}, "http://nrf.com", None),
+            ({}, None, "Invalid relation data: {}"),
+            ({"pizza": "steak"}, None, "Invalid relation data: {'pizza': 'steak'}"),
+        ],
+    )
+    def test_given_nrf_information_in_relation_data_when_get_nrf_url_then_expected_url_is_returned(  # noqa: E501
+        self, caplog, relation_data, expected_url, expected_log
     ):
-        nrf_relation = testing.Relation(
-            endpoint="fiveg_nrf",
-            interface="fiveg_nrf",
-            remote_app_data={
-                "url": "http://nrf.com",
-            },
-        )
+        nrf_relation = _nrf_relation(remote_app_data=relation_data)
         state_in = testing.State(
             relations=[nrf_relation],
         )
 
         self.ctx.run(self.ctx.on.action("get-nrf-url"), state_in)
 
-        assert self.ctx.action_results
         assert self.ctx.action_results == {
-            "nrf-url": "http://nrf.com",
+            "nrf-url": expected_url,
         }
-
-    def test_given_nrf_information_not_in_relation_data_when_get_nrf_url_then_returns_none(  # noqa: E501
-        self, caplog
-    ):
-        nrf_relation = testing.Relation(
-            endpoint="fiveg_nrf",
-            interface="fiveg_nrf",
-        )
-        state_in = testing.State(
-            relations=[nrf_relation],
-        )
-
-        self.ctx.run(self.ctx.on.action("get-nrf-url"), state_in)
-
-        assert self.ctx.action_results
-        assert self.ctx.action_results == {
-            "nrf-url": None,
-        }
-        assert "Invalid relation data: {}" in caplog.messages
-
-    def test_given_nrf_information_in_relation_data_is_not_valid_when_get_nrf_url_then_returns_none_and_error_is_logged(  # noqa: E501
-        self, caplog
-    ):
-        nrf_relation = testing.Relation(
-            endpoint="fiveg_nrf",
-            interface="fiveg_nrf",
-            remote_app_data={
-                "pizza": "steak",
-            },
-        )
-        state_in = testing.State(
-            relations=[nrf_relation],
-        )
-
-        self.ctx.run(self.ctx.on.action("get-nrf-url"), state_in)
-
-        assert self.ctx.action_results
-        assert self.ctx.action_results == {
-            "nrf-url": None,
-        }
-        assert "Invalid relation data: {'pizza': 'steak'}" in caplog.messages
+        if expected_log:
+            assert expected_log in caplog.messages
 
     def test_given_nrf_relation_created_when_relation_broken_then_nrf_broken_event_emitted(self):
-        nrf_relation = testing.Relation(
-            endpoint="fiveg_nrf",
-            interface="fiveg_nrf",
-        )
+        nrf_relation = _nrf_relation()
         state_in = testing.State(
             relations=[nrf_relation],
         )
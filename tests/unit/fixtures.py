@@ -1,62 +1,76 @@
 # Copyright 2024 Canonical Ltd.
 # See LICENSE file for licensing details.
 
-from unittest.mock import PropertyMock, patch
+from pathlib import Path
+from unittest.mock import MagicMock, PropertyMock
 
 import pytest
+import yaml
 from ops import testing
 
 from charm import NRFOperatorCharm
 
+CHARMCRAFT = yaml.safe_load(Path("charmcraft.yaml").read_text())
+
 
 class NRFUnitTestFixtures:
-    patcher_database_resource_created = patch(
-        "charms.data_platform_libs.v0.data_interfaces.DatabaseRequires.is_resource_created"
-    )
-    patcher_database_relation_data = patch(
-        "charms.data_platform_libs.v0.data_interfaces.DatabaseRequires.fetch_relation_data"
-    )
-    patcher_sdcore_config_webui_url = patch(
-        "charms.sdcore_nms_k8s.v0.sdcore_config.SdcoreConfigRequires.webui_url",
-        new_callable=PropertyMock,
-    )
-    patcher_get_assigned_certificate = patch(
-        "charms.tls_certificates_interface.v4.tls_certificates.TLSCertificatesRequiresV4.get_assigned_certificate"
-    )
-    patcher_set_nrf_information = patch(
-        "charms.sdcore_nrf_k8s.v0.fiveg_nrf.NRFProvides.set_nrf_information"
-    )
-    patcher_set_nrf_information_in_all_relations = patch(
-        "charms.sdcore_nrf_k8s.v0.fiveg_nrf.NRFProvides.set_nrf_information_in_all_relations"
-    )
+    @pytest.fixture(scope="class", autouse=True)
+    @classmethod
+    def patch_libraries(cls):
+        cls.started_mocks = {
+            "database_resource_created": MagicMock(),
+            "database_relation_data": MagicMock(),
+            "sdcore_config_webui_url": PropertyMock(),
+            "get_assigned_certificate": MagicMock(),
+            "set_nrf_information": MagicMock(),
+            "set_nrf_information_in_all_relations": MagicMock(),
+        }
+        with pytest.MonkeyPatch.context() as monkeypatch:
+            monkeypatch.setattr(
+                "charms.data_platform_libs.v0.data_interfaces.DatabaseRequires.is_resource_created",
+                cls.started_mocks["database_resource_created"],
+            )
+            monkeypatch.setattr(
+                "charms.data_platform_libs.v0.data_interfaces.DatabaseRequires.fetch_relation_data",
+                cls.started_mocks["database_relation_data"],
+            )
+            monkeypatch.setattr(
+                "charms.sdcore_nms_k8s.v0.sdcore_config.SdcoreConfigRequires.webui_url",
+                cls.started_mocks["sdcore_config_webui_url"],
+            )
+            monkeypatch.setattr(
+                "charms.tls_certificates_interface.v4.tls_certificates.TLSCertificatesRequiresV4.get_assigned_certificate",
+                cls.started_mocks["get_assigned_certificate"],
+            )
+            monkeypatch.setattr(
+                "charms.sdcore_nrf_k8s.v0.fiveg_nrf.NRFProvides.set_nrf_information",
+                cls.started_mocks["set_nrf_information"],
+            )
+            monkeypatch.setattr(
+                "charms.sdcore_nrf_k8s.v0.fiveg_nrf.NRFProvides.set_nrf_information_in_all_relations",
+                cls.started_mocks["set_nrf_information_in_all_relations"],
+            )
+            yield
 
     @pytest.fixture(autouse=True)
-    def setup(self, request):
-        self.mock_database_resource_created = (
-            NRFUnitTestFixtures.patcher_database_resource_created.start()
-        )
-        self.mock_database_relation_data = (
-            NRFUnitTestFixtures.patcher_database_relation_data.start()
-        )
-        self.mock_sdcore_config_webui_url = (
-            NRFUnitTestFixtures.patcher_sdcore_config_webui_url.start()
-        )
-        self.mock_get_assigned_certificate = (
-            NRFUnitTestFixtures.patcher_get_assigned_certificate.start()
-        )
-        self.mock_set_nrf_information = NRFUnitTestFixtures.patcher_set_nrf_information.start()
-        self.mock_set_nrf_information_in_all_relations = (
-            NRFUnitTestFixtures.patcher_set_nrf_information_in_all_relations.start()
-        )
-        yield
-        request.addfinalizer(self.teardown)
+    def setup(self):
+        for mock in self.started_mocks.values():
+            mock.reset_mock(return_value=True, side_effect=True)
+        self.mock_database_resource_created = self.started_mocks["database_resource_created"]
+        self.mock_database_relation_data = self.started_mocks["database_relation_data"]
+        self.mock_sdcore_config_webui_url = self.started_mocks["sdcore_config_webui_url"]
+        self.mock_get_assigned_certificate = self.started_mocks["get_assigned_certificate"]
+        self.mock_set_nrf_information = self.started_mocks["set_nrf_information"]
+        self.mock_set_nrf_information_in_all_relations = self.started_mocks[
+            "set_nrf_information_in_all_relations"
+        ]
 
-    @staticmethod
-    def teardown() -> None:
-        patch.stopall()
-
-    @pytest.fixture(autouse=True)
-    def context(self):
-        self.ctx = testing.Context(
+    @pytest.fixture(scope="class", autouse=True)
+    @classmethod
+    def context(cls):
+        cls.ctx = testing.Context(
             charm_type=NRFOperatorCharm,
+            meta=CHARMCRAFT,
+            actions=CHARMCRAFT.get("actions"),
+            config=CHARMCRAFT.get("config"),
         )
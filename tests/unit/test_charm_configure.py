@@ -2,305 +2,256 @@
 # See LICENSE file for licensing details.
 
 
-import os
-import tempfile
+import dataclasses
+import hashlib
+from pathlib import Path
+from unittest.mock import MagicMock
 
-from ops import testing
-from ops.pebble import Layer
+import pytest
+from ops import Container, testing
+from ops.pebble import Layer, ServiceStatus
 
-from tests.unit.certificates_helpers import example_cert_and_key
+from tests.unit.certificates_helpers import example_cert_and_key, store_certificate_and_key
 from tests.unit.fixtures import NRFUnitTestFixtures
 
+EXPECTED_CONFIG = Path("tests/unit/expected_config/config.conf").read_text().strip()
+EXPECTED_LAYER = Layer(
+    {
+        "summary": "nrf layer",
+        "description": "pebble config layer for nrf",
+        "services": {
+            "nrf": {
+                "startup": "enabled",
+                "override": "replace",
+                "command": "/bin/nrf --cfg /etc/nrf/nrfcfg.yaml",
+                "environment": {
+                    "GRPC_GO_LOG_VERBOSITY_LEVEL": "99",
+                    "GRPC_GO_LOG_SEVERITY_LEVEL": "info",
+                    "GRPC_TRACE": "all",
+                    "GRPC_VERBOSITY": "debug",
+                    "MANAGED_BY_CONFIG_POD": "true",
+                },
+            }
+        },
+    }
+)
+
 
 class TestCharmConfigure(NRFUnitTestFixtures):
+    @pytest.fixture(autouse=True)
+    def configured_workload(self, setup, tmp_path):
+        """Prepare a state where every precondition to configure the workload is met."""
+        self.config_file = tmp_path / "nrfcfg.yaml"
+        self.certificate_file = tmp_path / "nrf.pem"
+        self.private_key_file = tmp_path / "nrf.key"
+        database_relation = testing.Relation(
+            endpoint="database",
+            interface="data-platform",
+        )
+        certificates_relation = testing.Relation(
+            endpoint="certificates",
+            interface="tls-certificates",
+        )
+        nms_relation = testing.Relation(
+            endpoint="sdcore_config",
+            interface="sdcore_config",
+        )
+        config_mount = testing.Mount(
+            location="/etc/nrf",
+            source=tmp_path,
+        )
+        certs_mount = testing.Mount(
+            location="/support/TLS",
+            source=tmp_path,
+        )
+        self.container = testing.Container(
+            name="nrf",
+            can_connect=True,
+            mounts={"config": config_mount, "certs": certs_mount},
+        )
+        self.state_in = testing.State(
+            containers=[self.container],
+            relations=[database_relation, certificates_relation, nms_relation],
+            leader=True,
+        )
+        self.mock_database_resource_created.return_value = True
+        self.mock_database_relation_data.return_value = {
+            database_relation.id: {"uris": "http://dummy"},
+        }
+        self.mock_sdcore_config_webui_url.return_value = "some-webui:7890"
+        self.provider_certificate, self.private_key = example_cert_and_key(
+            tls_relation_id=certificates_relation.id
+        )
+        self.mock_get_assigned_certificate.return_value = (
+            self.provider_certificate,
+            self.private_key,
+        )
+
     def test_given_database_info_and_storage_attached_and_certs_stored_when_configure_then_config_file_is_rendered_and_pushed(  # noqa: E501
         self,
     ):
-        with tempfile.TemporaryDirectory() as temp_dir:
-            database_relation = testing.Relation(
-                endpoint="database",
-                interface="data-platform",
-            )
-            certificates_relation = testing.Relation(
-                endpoint="certificates",
-                interface="tls-certificates",
-            )
-            nms_relation = testing.Relation(
-                endpoint="sdcore_config",
-                interface="sdcore_config",
-            )
-            config_mount = testing.Mount(
-                location="/etc/nrf",
-                source=temp_dir,
-            )
-            certs_mount = testing.Mount(
-                location="/support/TLS",
-                source=temp_dir,
-            )
-            container = testing.Container(
-                name="nrf",
-                can_connect=True,
-                mounts={"config": config_mount, "certs": certs_mount},
-            )
-            state_in = testing.State(
-                containers=[container],
-                relations=[database_relation, certificates_relation, nms_relation],
-                leader=True,
-            )
-            self.mock_database_resource_created.return_value = True
-            self.mock_database_relation_data.return_value = {
-                database_relation.id: {"uris": "http://dummy"},
-            }
-            self.mock_sdcore_config_webui_url.return_value = "some-webui:7890"
-            provider_certificate, private_key = example_cert_and_key(
-                tls_relation_id=certificates_relation.id
-            )
-            self.mock_get_assigned_certificate.return_value = (provider_certificate, private_key)
+        self.ctx.run(self.ctx.on.pebble_ready(container=self.container), self.state_in)
 
-            self.ctx.run(self.ctx.on.pebble_ready(container=container), state_in)
+        assert self.config_file.read_text().strip() == EXPECTED_CONFIG
 
-            with open(f"{temp_dir}/nrfcfg.yaml", "r") as config_file:
-                config_content = config_file.read()
+    def test_given_content_of_config_file_not_changed_when_configure_then_config_file_is_not_pushed(  # noqa: E501
+        self,
+    ):
+        self.config_file.write_text(EXPECTED_CONFIG)
+        config_modification_time = self.config_file.stat().st_mtime
 
-            with open("tests/unit/expected_config/config.conf", "r") as expected_config_file:
-                expected_content = expected_config_file.read()
+        self.ctx.run(self.ctx.on.pebble_ready(container=self.container), self.state_in)
 
-            assert config_content.strip() == expected_content.strip()
+        assert self.config_file.read_text().strip() == EXPECTED_CONFIG
+        assert self.config_file.stat().st_mtime == config_modification_time
 
-    def test_given_content_of_config_file_not_changed_when_configure_then_config_file_is_not_pushed(  # noqa: E501
+    def test_given_config_pushed_when_configure_then_pebble_plan_is_applied(
         self,
     ):
-        with tempfile.TemporaryDirectory() as temp_dir:
-            database_relation = testing.Relation(
-                endpoint="database",
-                interface="data-platform",
-            )
-            certificates_relation = testing.Relation(
-                endpoint="certificates",
-                interface="tls-certificates",
-            )
-            nms_relation = testing.Relation(
-                endpoint="sdcore_config",
-                interface="sdcore_config",
-            )
-            config_mount = testing.Mount(
-                location="/etc/nrf",
-                source=temp_dir,
-            )
-            certs_mount = testing.Mount(
-                location="/support/TLS",
-                source=temp_dir,
-            )
-            container = testing.Container(
-                name="nrf",
-                can_connect=True,
-                mounts={"config": config_mount, "certs": certs_mount},
-            )
-            state_in = testing.State(
-                containers=[container],
-                relations=[database_relation, certificates_relation, nms_relation],
-                leader=True,
-            )
-            self.mock_database_resource_created.return_value = True
-            self.mock_database_relation_data.return_value = {
-                database_relation.id: {"uris": "http://dummy"},
-            }
-            self.mock_sdcore_config_webui_url.return_value = "some-webui:7890"
-            provider_certificate, private_key = example_cert_and_key(
-                tls_relation_id=certificates_relation.id
-            )
-            self.mock_get_assigned_certificate.return_value = (provider_certificate, private_key)
-            with open("tests/unit/expected_config/config.conf", "r") as expected_config_file:
-                expected_content = expected_config_file.read()
-            with open(f"{temp_dir}/nrfcfg.yaml", "w") as config_file:
-                config_file.write(expected_content.strip())
-            config_modification_time = os.stat(temp_dir + "/nrfcfg.yaml").st_mtime
+        state_out = self.ctx.run(self.ctx.on.pebble_ready(container=self.container), self.state_in)
+
+        container = state_out.get_container("nrf")
+        assert container.layers["nrf"] == EXPECTED_LAYER
 
-            self.ctx.run(self.ctx.on.pebble_ready(container=container), state_in)
+    def test_given_certificate_digests_match_stored_ones_when_configure_then_certificate_files_are_not_pulled_nor_pushed(  # noqa: E501
+        self, monkeypatch
+    ):
+        store_certificate_and_key(
+            self.certificate_file.parent, certificate="stale cert", private_key="stale key"
+        )
+        stored_state = testing.StoredState(
+            owner_path="NRFOperatorCharm",
+            content={
+                "certificate_digest": hashlib.sha256(
+                    str(self.provider_certificate.certificate).encode()
+                ).hexdigest(),
+                "private_key_digest": hashlib.sha256(str(self.private_key).encode()).hexdigest(),
+            },
+        )
+        state_in = dataclasses.replace(self.state_in, stored_states=[stored_state])
+        pulled_paths = []
+        pull = Container.pull
 
-            with open(f"{temp_dir}/nrfcfg.yaml", "r") as config_file:
-                config_content = config_file.read()
+        def record_pull(container, path, *args, **kwargs):
+            pulled_paths.append(path)
+            return pull(container, path, *args, **kwargs)
 
-            with open("tests/unit/expected_config/config.conf", "r") as expected_config_file:
-                expected_content = expected_config_file.read()
+        monkeypatch.setattr(Container, "pull", record_pull)
 
-            assert config_content.strip() == expected_content.strip()
-            assert os.stat(temp_dir + "/nrfcfg.yaml").st_mtime == config_modification_time
+        self.ctx.run(self.ctx.on.pebble_ready(container=self.container), state_in)
 
-    def test_given_config_pushed_when_configure_then_pebble_plan_is_applied(
-        self,
+        assert "/support/TLS/nrf.pem" not in pulled_paths
+        assert "/support/TLS/nrf.key" not in pulled_paths
+        assert self.certificate_file.read_text() == "stale cert"
+        assert self.private_key_file.read_text() == "stale key"
+
+    def test_given_layer_and_config_changed_when_configure_then_service_is_replanned_once_and_not_restarted(  # noqa: E501
+        self, monkeypatch
     ):
-        with tempfile.TemporaryDirectory() as temp_dir:
-            database_relation = testing.Relation(
-                endpoint="database",
-                interface="data-platform",
-            )
-            certificates_relation = testing.Relation(
-                endpoint="certificates",
-                interface="tls-certificates",
-            )
-            nms_relation = testing.Relation(
-                endpoint="sdcore_config",
-                interface="sdcore_config",
-            )
-            config_mount = testing.Mount(
-                location="/etc/nrf",
-                source=temp_dir,
-            )
-            certs_mount = testing.Mount(
-                location="/support/TLS",
-                source=temp_dir,
-            )
-            container = testing.Container(
-                name="nrf",
-                can_connect=True,
-                mounts={"config": config_mount, "certs": certs_mount},
-            )
-            state_in = testing.State(
-                containers=[container],
-                relations=[database_relation, certificates_relation, nms_relation],
-                leader=True,
-            )
-            self.mock_database_resource_created.return_value = True
-            self.mock_database_relation_data.return_value = {
-                database_relation.id: {"uris": "http://dummy"},
-            }
-            self.mock_sdcore_config_webui_url.return_value = "some-webui:7890"
-            provider_certificate, private_key = example_cert_and_key(
-                tls_relation_id=certificates_relation.id
-            )
-            self.mock_get_assigned_certificate.return_value = (provider_certificate, private_key)
-
-            state_out = self.ctx.run(self.ctx.on.pebble_ready(container=container), state_in)
-
-            container = state_out.get_container("nrf")
-            assert container.layers["nrf"] == Layer(
-                {
-                    "summary": "nrf layer",
-                    "description": "pebble config layer for nrf",
-                    "services": {
-                        "nrf": {
-                            "startup": "enabled",
-                            "override": "replace",
-                            "command": "/bin/nrf --cfg /etc/nrf/nrfcfg.yaml",
-                            "environment": {
-                                "GRPC_GO_LOG_VERBOSITY_LEVEL": "99",
-                                "GRPC_GO_LOG_SEVERITY_LEVEL": "info",
-                                "GRPC_TRACE": "all",
-                                "GRPC_VERBOSITY": "debug",
-                                "MANAGED_BY_CONFIG_POD": "true",
-                            },
-                        }
-                    },
-                }
-            )
+        replan = MagicMock()
+        restart = MagicMock()
+        monkeypatch.setattr("ops.Container.replan", replan)
+        monkeypatch.setattr("ops.Container.restart", restart)
+
+        self.ctx.run(self.ctx.on.pebble_ready(container=self.container), self.state_in)
+
+        replan.assert_called_once()
+        restart.assert_not_called()
+
+    @pytest.mark.parametrize("changed_file", ["config", "certificate"])
+    def test_given_layer_applied_and_config_or_certificate_changed_when_configure_then_service_is_restarted(  # noqa: E501
+        self, monkeypatch, changed_file
+    ):
+        if changed_file == "config":
+            store_certificate_and_key(
+                self.certificate_file.parent,
+                certificate=str(self.provider_certificate.certificate),
+                private_key=str(self.private_key),
+            )
+        else:
+            self.config_file.write_text(EXPECTED_CONFIG)
+        container = dataclasses.replace(
+            self.container,
+            layers={"nrf": EXPECTED_LAYER},
+            service_statuses={"nrf": ServiceStatus.ACTIVE},
+        )
+        state_in = dataclasses.replace(self.state_in, containers=[container])
+        replan = MagicMock()
+        restart = MagicMock()
+        monkeypatch.setattr("ops.Container.replan", replan)
+        monkeypatch.setattr("ops.Container.restart", restart)
 
+        self.ctx.run(self.ctx.on.pebble_ready(container=container), state_in)
+
+        replan.assert_not_called()
+        restart.assert_called_once_with("nrf")
+
+    @pytest.mark.parametrize("n_requirers", [1, 2])
     def test_service_starts_running_after_nrf_relation_joined_when_configure_then_nrf_url_is_in_relation_databag(  # noqa: E501
-        self,
+        self, n_requirers
     ):
-        with tempfile.TemporaryDirectory() as temp_dir:
-            database_relation = testing.Relation(
-                endpoint="database",
-                interface="data-platform",
-            )
-            certificates_relation = testing.Relation(
-                endpoint="certificates",
-                interface="tls-certificates",
-            )
-            nms_relation = testing.Relation(
-                endpoint="sdcore_config",
-                interface="sdcore_config",
-            )
-            fiveg_nrf_relation = testing.Relation(
+        fiveg_nrf_relations = [
+            testing.Relation(
                 endpoint="fiveg_nrf",
                 interface="fiveg_nrf",
             )
-            config_mount = testing.Mount(
-                location="/etc/nrf",
-                source=temp_dir,
-            )
-            certs_mount = testing.Mount(
-                location="/support/TLS",
-                source=temp_dir,
-            )
-            container = testing.Container(
-                name="nrf",
-                can_connect=True,
-                mounts={"config": config_mount, "certs": certs_mount},
-            )
-            state_in = testing.State(
-                containers=[container],
-                relations=[
-                    database_relation,
-                    certificates_relation,
-                    nms_relation,
-                    fiveg_nrf_relation,
-                ],
-                leader=True,
-            )
-            self.mock_database_resource_created.return_value = True
-            self.mock_database_relation_data.return_value = {
-                database_relation.id: {"uris": "http://dummy"},
-            }
-            self.mock_sdcore_config_webui_url.return_value = "some-webui:7890"
-            provider_certificate, private_key = example_cert_and_key(
-                tls_relation_id=certificates_relation.id
-            )
-            self.mock_get_assigned_certificate.return_value = (provider_certificate, private_key)
+            for _ in range(n_requirers)
+        ]
+        state_in = dataclasses.replace(
+            self.state_in, relations=[*self.state_in.relations, *fiveg_nrf_relations]
+        )
 
-            self.ctx.run(self.ctx.on.pebble_ready(container=container), state_in)
+        self.ctx.run(self.ctx.on.pebble_ready(container=self.container), state_in)
 
-            self.mock_set_nrf_information_in_all_relations.assert_called_once()
+        self.mock_set_nrf_information_in_all_relations.assert_called_once()
 
     def test_given_certificate_available_when_configure_then_certificate_is_pushed(
         self,
     ):
-        with tempfile.TemporaryDirectory() as temp_dir:
-            database_relation = testing.Relation(
-                endpoint="database",
-                interface="data-platform",
-            )
-            certificates_relation = testing.Relation(
-                endpoint="certificates",
-                interface="tls-certificates",
-            )
-            nms_relation = testing.Relation(
-                endpoint="sdcore_config",
-                interface="sdcore_config",
-            )
-            config_mount = testing.Mount(
-                location="/etc/nrf",
-                source=temp_dir,
-            )
-            certs_mount = testing.Mount(
-                location="/support/TLS",
-                source=temp_dir,
-            )
-            container = testing.Container(
-                name="nrf",
-                can_connect=True,
-                mounts={"config": config_mount, "certs": certs_mount},
-            )
-            state_in = testing.State(
-                containers=[container],
-                relations=[
-                    database_relation,
-                    certificates_relation,
-                    nms_relation,
-                ],
-                leader=True,
-            )
-            provider_certificate, private_key = example_cert_and_key(
-                tls_relation_id=certificates_relation.id
-            )
-            self.mock_get_assigned_certificate.return_value = (provider_certificate, private_key)
+        self.ctx.run(self.ctx.on.pebble_ready(container=self.container), self.state_in)
+
+        assert self.certificate_file.read_text() == str(self.provider_certificate.certificate)
+        assert self.private_key_file.read_text() == str(self.private_key)
 
-            self.ctx.run(self.ctx.on.pebble_ready(container=container), state_in)
+    def test_given_certificate_already_stored_when_configure_then_certificate_is_not_pushed(
+        self,
+    ):
+        store_certificate_and_key(
+            self.certificate_file.parent,
+            certificate=str(self.provider_certificate.certificate),
+            private_key=str(self.private_key),
+        )
+        certificate_modification_time = self.certificate_file.stat().st_mtime
+        private_key_modification_time = self.private_key_file.stat().st_mtime
+
+        self.ctx.run(self.ctx.on.pebble_ready(container=self.container), self.state_in)
+
+        assert self.certificate_file.stat().st_mtime == certificate_modification_time
+        assert self.private_key_file.stat().st_mtime == private_key_modification_time
+
+    def test_given_configuration_already_applied_when_configure_then_workload_is_not_reconfigured_and_nrf_url_is_published(  # noqa: E501
+        self, monkeypatch
+    ):
+        state_out = self.ctx.run(self.ctx.on.pebble_ready(container=self.container), self.state_in)
+        fiveg_nrf_relation = testing.Relation(
+            endpoint="fiveg_nrf",
+            interface="fiveg_nrf",
+        )
+        state_in = dataclasses.replace(
+            state_out, relations=[*state_out.relations, fiveg_nrf_relation]
+        )
+        push = MagicMock()
+        replan = MagicMock()
+        restart = MagicMock()
+        monkeypatch.setattr("ops.Container.push", push)
+        monkeypatch.setattr("ops.Container.replan", replan)
+        monkeypatch.setattr("ops.Container.restart", restart)
 
-            with open(f"{temp_dir}/nrf.pem", "r") as f:
-                certificate = f.read()
-            with open(f"{temp_dir}/nrf.key", "r") as f:
-                private_key = f.read()
+        self.ctx.run(self.ctx.on.pebble_ready(container=state_out.get_container("nrf")), state_in)
 
-            assert certificate == str(provider_certificate.certificate)
-            assert private_key == str(private_key)
+        push.assert_not_called()
+        replan.assert_not_called()
+        restart.assert_not_called()
+        self.mock_set_nrf_information_in_all_relations.assert_called_once_with(
+            "https://sdcore-nrf-k8s:29510"
+        )